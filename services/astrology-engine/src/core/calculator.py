@@ -4,9 +4,12 @@ Astrology Calculator
 This module provides the core calculation service for astrological data,
 building on the Ephemeris Provider to perform specific astrological calculations.
 """
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 import math
+import numpy as np
 from loguru import logger
 
 from .ephemeris import EphemerisProvider
@@ -29,6 +32,12 @@ MINOR_ASPECTS = {
     "bi_quintile": {"angle": 144, "orb": 2, "influence": 0.2}
 }
 
+# All supported aspects in a single lookup table
+ALL_ASPECTS = {**MAJOR_ASPECTS, **MINOR_ASPECTS}
+
+# Aspects calculated when the caller does not ask for specific ones
+DEFAULT_ASPECTS = tuple(MAJOR_ASPECTS.keys())
+
 # Planet and zodiac sign properties
 PLANET_PROPERTIES = {
     "sun": {"element": "fire", "modality": None, "weight": 10},
@@ -61,6 +70,62 @@ SIGN_PROPERTIES = {
     "pisces": {"element": "water", "modality": "mutable", "polarity": "feminine"}
 }
 
+ELEMENTS = ("fire", "earth", "air", "water")
+MODALITIES = ("cardinal", "fixed", "mutable")
+
+# Flat lookups derived from the tables above for the per-planet loops
+PLANET_WEIGHTS = {planet: props["weight"] for planet, props in PLANET_PROPERTIES.items()}
+SIGN_ELEMENTS = {sign: props["element"] for sign, props in SIGN_PROPERTIES.items()}
+SIGN_MODALITIES = {sign: props["modality"] for sign, props in SIGN_PROPERTIES.items()}
+
+# Aspect table as parallel arrays, indexed through ASPECT_INDEX
+ASPECT_TYPES = tuple(ALL_ASPECTS)
+ASPECT_INDEX = {aspect: index for index, aspect in enumerate(ASPECT_TYPES)}
+ASPECT_ANGLES = np.array([ALL_ASPECTS[a]["angle"] for a in ASPECT_TYPES], dtype=np.float64)
+ASPECT_ORBS = np.array([ALL_ASPECTS[a]["orb"] for a in ASPECT_TYPES], dtype=np.float64)
+ASPECT_INFLUENCES = np.array([ALL_ASPECTS[a]["influence"] for a in ASPECT_TYPES], dtype=np.float64)
+
+
+class AspectHit(NamedTuple):
+    """
+    A single aspect found between two planets.
+    
+    Kept as a tuple rather than a dict to avoid per-aspect dict allocation;
+    use ``_asdict()`` when a mapping is needed at the serialization boundary.
+    """
+    planet1: str
+    planet2: str
+    type: str
+    angle: float
+    orb: float
+    applying: bool
+    influence: float
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_time(date: str, time: str) -> Tuple[int, int, int, float]:
+    """Parse YYYY-MM-DD and HH:MM:SS strings into year, month, day and decimal hour."""
+    year, month, day = map(int, date.split('-'))
+    hour, minute, second = map(int, time.split(':'))
+    return year, month, day, hour + minute/60.0 + second/3600.0
+
+
+def circ_diff(a, b):
+    """
+    Shortest angular distance between two longitudes, in degrees (0-180).
+    
+    Works on plain floats as well as NumPy arrays, without branching.
+    
+    Args:
+        a: First longitude (or array of longitudes)
+        b: Second longitude (or array of longitudes)
+        
+    Returns:
+        Absolute angular separation folded into the 0-180 range
+    """
+    return abs((a - b + 540.0) % 360.0 - 180.0)
+
+
 class AstrologyCalculator:
     """
     Core calculation service for astrological data.
@@ -88,14 +153,9 @@ class AstrologyCalculator:
         Returns:
             Julian day number
         """
-        # Parse date
-        year, month, day = map(int, date.split('-'))
-        
-        # Parse time
-        hour, minute, second = map(int, time.split(':'))
-        
-        # Convert to decimal hours
-        decimal_hour = hour + minute/60.0 + second/3600.0
+        # Parse date and time into decimal hours; the same birth data is
+        # converted on every request for a user, so the parse is memoized
+        year, month, day, decimal_hour = _parse_date_time(date, time)
         
         # TODO: Handle timezone conversion properly
         # For now, assuming time is already in UT/GMT
@@ -158,7 +218,7 @@ class AstrologyCalculator:
         planet_positions: Dict[str, Dict[str, Any]],
         aspects_to_calculate: Optional[List[str]] = None,
         custom_orbs: Optional[Dict[str, float]] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[AspectHit]:
         """
         Calculate aspects between planets.
         
@@ -168,81 +228,80 @@ class AstrologyCalculator:
             custom_orbs: Dictionary with custom orbs for aspects
             
         Returns:
-            List of aspects between planets
+            List of AspectHit records, strongest first. These are tuples with
+            attribute access, not dicts: call ``_asdict()`` on each hit before
+            indexing by key or serializing to JSON (they would otherwise
+            encode as arrays)
         """
         if aspects_to_calculate is None:
             # Default to major aspects
-            aspects_to_calculate = list(MAJOR_ASPECTS.keys())
-        
-        # Combine major and minor aspects based on what's requested
-        aspect_data = {}
-        for aspect in aspects_to_calculate:
-            if aspect in MAJOR_ASPECTS:
-                aspect_data[aspect] = MAJOR_ASPECTS[aspect]
-            elif aspect in MINOR_ASPECTS:
-                aspect_data[aspect] = MINOR_ASPECTS[aspect]
-        
-        # Apply custom orbs if provided
+            aspects_to_calculate = DEFAULT_ASPECTS
+        
+        # Select the requested aspects from the shared arrays
+        selected = [
+            ASPECT_INDEX[aspect]
+            for aspect in dict.fromkeys(aspects_to_calculate)
+            if aspect in ASPECT_INDEX
+        ]
+        aspect_types = [ASPECT_TYPES[index] for index in selected]
+        aspect_angles = ASPECT_ANGLES[selected]
+        max_orbs = ASPECT_ORBS[selected]
+        influences = ASPECT_INFLUENCES[selected]
+        
+        # Apply custom orbs if provided (fancy indexing copied the shared arrays)
         if custom_orbs:
-            for aspect, orb in custom_orbs.items():
-                if aspect in aspect_data:
-                    aspect_data[aspect]["orb"] = orb
-        
-        # Calculate aspects between all planets
+            for position, aspect in enumerate(aspect_types):
+                if aspect in custom_orbs:
+                    max_orbs[position] = custom_orbs[aspect]
+        
+        # Planet longitudes as an array
+        planet_names = list(planet_positions)
+        longitudes = np.fromiter(
+            (planet_positions[planet]["longitude"] for planet in planet_names),
+            dtype=np.float64,
+            count=len(planet_names)
+        )
+        
+        # Angle between every unordered pair of planets
+        first, second = np.triu_indices(len(planet_names), k=1)
+        angles = circ_diff(longitudes[first], longitudes[second])
+        
+        # Orb of every pair against every aspect, and the hits within orb
+        orbs = np.abs(angles[:, None] - aspect_angles[None, :])
+        pair_hits, aspect_hits = np.nonzero(orbs <= max_orbs[None, :])
+        
+        # Format the hits
         aspects = []
-        calculated_pairs = set()
-        
-        for planet1 in planet_positions:
-            for planet2 in planet_positions:
-                # Skip same planet and already calculated pairs
-                if planet1 == planet2 or (planet1, planet2) in calculated_pairs or (planet2, planet1) in calculated_pairs:
-                    continue
-                
-                # Add to calculated pairs
-                calculated_pairs.add((planet1, planet2))
-                
-                # Get planet longitudes
-                longitude1 = planet_positions[planet1]["longitude"]
-                longitude2 = planet_positions[planet2]["longitude"]
-                
-                # Calculate angle between planets
-                angle = abs(longitude1 - longitude2)
-                if angle > 180:
-                    angle = 360 - angle
-                
-                # Check for aspects
-                for aspect_type, aspect_info in aspect_data.items():
-                    aspect_angle = aspect_info["angle"]
-                    max_orb = aspect_info["orb"]
-                    base_influence = aspect_info["influence"]
-                    
-                    # Calculate orb
-                    orb = abs(angle - aspect_angle)
-                    
-                    # Check if within orb
-                    if orb <= max_orb:
-                        # Calculate influence based on orb
-                        influence = base_influence * (1 - orb / max_orb)
-                        
-                        # Determine if applying or separating
-                        # This is a simplification - true calculation requires knowing planet speeds
-                        speed1 = planet_positions[planet1].get("speed", 0)
-                        speed2 = planet_positions[planet2].get("speed", 0)
-                        applying = self._is_aspect_applying(longitude1, longitude2, speed1, speed2, aspect_angle)
-                        
-                        # Add aspect to results
-                        aspects.append({
-                            "planet1": planet1,
-                            "planet2": planet2,
-                            "type": aspect_type,
-                            "angle": aspect_angle,
-                            "orb": orb,
-                            "applying": applying,
-                            "influence": influence
-                        })
+        max_orb_values = max_orbs.tolist()
+        influence_values = influences.tolist()
+        for pair_idx, aspect_idx in zip(pair_hits.tolist(), aspect_hits.tolist()):
+            planet1 = planet_names[first[pair_idx]]
+            planet2 = planet_names[second[pair_idx]]
+            aspect_type = aspect_types[aspect_idx]
+            aspect_angle = ALL_ASPECTS[aspect_type]["angle"]
+            orb = float(orbs[pair_idx, aspect_idx])
+            
+            # Calculate influence based on orb
+            influence = influence_values[aspect_idx] * (1 - orb / max_orb_values[aspect_idx])
+            
+            # Determine if applying or separating
+            # This is a simplification - true calculation requires knowing planet speeds
+            position1 = planet_positions[planet1]
+            position2 = planet_positions[planet2]
+            applying = self._is_aspect_applying(
+                position1["longitude"], position2["longitude"],
+                position1.get("speed", 0), position2.get("speed", 0),
+                aspect_angle
+            )
+            
+            # Add aspect to results
+            aspects.append(AspectHit(
+                planet1, planet2, aspect_type, aspect_angle,
+                orb, applying, influence
+            ))
         
         # Sort aspects by influence
-        aspects.sort(key=lambda x: x["influence"], reverse=True)
+        aspects.sort(key=attrgetter("influence"), reverse=True)
         
         return aspects
     
@@ -256,42 +315,7 @@ class AstrologyCalculator:
         Returns:
             Dictionary with element percentages
         """
-        # Initialize element scores
-        element_scores = {
-            "fire": 0.0,
-            "earth": 0.0,
-            "air": 0.0,
-            "water": 0.0
-        }
-        
-        # Initialize total weight
-        total_weight = 0.0
-        
-        # Calculate weighted scores
-        for planet, position in planet_positions.items():
-            # Skip if planet doesn't have properties defined
-            if planet not in PLANET_PROPERTIES:
-                continue
-            
-            # Get planet weight
-            weight = PLANET_PROPERTIES[planet]["weight"]
-            total_weight += weight
-            
-            # Get sign of planet
-            sign = position["sign"]
-            
-            # Get element of sign
-            element = SIGN_PROPERTIES[sign]["element"]
-            
-            # Add weighted score to element
-            element_scores[element] += weight
-        
-        # Convert to percentages
-        if total_weight > 0:
-            for element in element_scores:
-                element_scores[element] = (element_scores[element] / total_weight) * 100
-        
-        return element_scores
+        return self._calculate_weighted_balance(planet_positions, SIGN_ELEMENTS, ELEMENTS)
     
     def calculate_modality_balance(self, planet_positions: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
         """
@@ -303,41 +327,7 @@ class AstrologyCalculator:
         Returns:
             Dictionary with modality percentages
         """
-        # Initialize modality scores
-        modality_scores = {
-            "cardinal": 0.0,
-            "fixed": 0.0,
-            "mutable": 0.0
-        }
-        
-        # Initialize total weight
-        total_weight = 0.0
-        
-        # Calculate weighted scores
-        for planet, position in planet_positions.items():
-            # Skip if planet doesn't have properties defined
-            if planet not in PLANET_PROPERTIES:
-                continue
-            
-            # Get planet weight
-            weight = PLANET_PROPERTIES[planet]["weight"]
-            total_weight += weight
-            
-            # Get sign of planet
-            sign = position["sign"]
-            
-            # Get modality of sign
-            modality = SIGN_PROPERTIES[sign]["modality"]
-            
-            # Add weighted score to modality
-            modality_scores[modality] += weight
-        
-        # Convert to percentages
-        if total_weight > 0:
-            for modality in modality_scores:
-                modality_scores[modality] = (modality_scores[modality] / total_weight) * 100
-        
-        return modality_scores
+        return self._calculate_weighted_balance(planet_positions, SIGN_MODALITIES, MODALITIES)
     
     def get_sign_name(self, longitude: float) -> str:
         """
@@ -363,6 +353,47 @@ class AstrologyCalculator:
         """
         return SIGN_PROPERTIES.get(sign_name.lower(), {})
     
+    def _calculate_weighted_balance(
+        self,
+        planet_positions: Dict[str, Dict[str, Any]],
+        category_by_sign: Dict[str, str],
+        categories: Tuple[str, ...]
+    ) -> Dict[str, float]:
+        """
+        Calculate weighted percentages of a sign property across planets.
+        
+        Args:
+            planet_positions: Dictionary with planet positions
+            category_by_sign: Mapping of sign name to category (element, modality)
+            categories: All categories to report, in output order
+            
+        Returns:
+            Dictionary with category percentages
+        """
+        # Initialize scores
+        scores = dict.fromkeys(categories, 0.0)
+        
+        # Initialize total weight
+        total_weight = 0.0
+        
+        # Calculate weighted scores
+        for planet, position in planet_positions.items():
+            # Skip if planet doesn't have properties defined
+            weight = PLANET_WEIGHTS.get(planet)
+            if weight is None:
+                continue
+            total_weight += weight
+            
+            # Add weighted score to the category of the planet's sign
+            scores[category_by_sign[position["sign"]]] += weight
+        
+        # Convert to percentages
+        if total_weight > 0:
+            for category in scores:
+                scores[category] = (scores[category] / total_weight) * 100
+        
+        return scores
+    
     def _is_aspect_applying(
         self,
         longitude1: float,
@@ -395,9 +426,7 @@ class AstrologyCalculator:
             return False
         
         # Calculate current angular separation
-        separation = (longitude1 - longitude2) % 360
-        if separation > 180:
-            separation = 360 - separation
+        separation = circ_diff(longitude1, longitude2)
         
         # For a conjunction (0°)
         if aspect_angle == 0:
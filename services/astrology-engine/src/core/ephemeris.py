@@ -4,7 +4,8 @@ Ephemeris Provider Interface
 This module provides an abstraction over the Swiss Ephemeris library
 for astronomical and astrological calculations.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
 import os
 from loguru import logger
 
@@ -33,6 +34,10 @@ PLANETS = {
     "chiron": swe.CHIRON if SWISS_EPH_AVAILABLE else 15
 }
 
+# Explicit calculation flags: Swiss Ephemeris files, always with speeds
+# (speed is needed for retrograde detection)
+CALC_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED if SWISS_EPH_AVAILABLE else 0
+
 HOUSE_SYSTEMS = {
     "placidus": b'P',
     "koch": b'K',
@@ -49,6 +54,12 @@ HOUSE_SYSTEMS = {
     "equal_mc": b'L'
 }
 
+# Julian days are keyed in whole seconds in the ephemeris caches
+SECONDS_PER_DAY = 86400.0
+
+# Decimal places kept for latitude/longitude in cache keys (about 11 meters)
+COORDINATE_KEY_PRECISION = 4
+
 # Signs and their properties
 SIGNS = {
     "aries": {"element": "fire", "modality": "cardinal", "start_degree": 0},
@@ -65,6 +76,9 @@ SIGNS = {
     "pisces": {"element": "water", "modality": "mutable", "start_degree": 330}
 }
 
+# Sign names in zodiac order, indexed by int(longitude / 30)
+SIGN_NAMES = tuple(SIGNS.keys())
+
 # Mapping of degrees to signs
 SIGN_FOR_DEGREE = [
     "aries", "aries", "taurus", "taurus", "gemini", "gemini",
@@ -74,6 +88,49 @@ SIGN_FOR_DEGREE = [
 ]
 
 
+def decode_longitude(longitude: float) -> Tuple[str, float]:
+    """
+    Split an ecliptic longitude into its sign and the degree within that sign.
+    
+    Args:
+        longitude: Longitude in degrees (0-360)
+        
+    Returns:
+        Tuple of sign name and degree within the sign (0-30)
+    """
+    return SIGN_NAMES[int(longitude / 30) % 12], longitude % 30
+
+
+@lru_cache(maxsize=65536)
+def _calc_ut_cached(jd_key: int, planet_id: int) -> Tuple[float, ...]:
+    """
+    Memoized swe.calc_ut call.
+    
+    The Julian day is keyed in whole seconds; even the Moon moves only about
+    half an arcsecond in that time, so transit dashboards and repeated charts
+    for the same moment hit the cache.
+    """
+    xx, _ = swe.calc_ut(jd_key / SECONDS_PER_DAY, planet_id, CALC_FLAGS)
+    return tuple(xx)
+
+
+@lru_cache(maxsize=4096)
+def _houses_cached(
+    jd_key: int,
+    latitude: float,
+    longitude: float,
+    house_system_code: bytes
+) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Memoized swe.houses call.
+    
+    The Julian day is keyed in whole seconds so repeat queries for the same
+    chart skip the (iterative, for Placidus) house computation entirely.
+    """
+    cusps, ascmc = swe.houses(jd_key / SECONDS_PER_DAY, latitude, longitude, house_system_code)
+    return tuple(cusps[:12]), tuple(ascmc)
+
+
 class EphemerisProvider:
     """
     Provider for ephemeris calculations using Swiss Ephemeris.
@@ -121,15 +178,18 @@ class EphemerisProvider:
         if planet_id is None:
             raise ValueError(f"Unknown planet: {planet}")
         
+        # Positions are cached per second of time
+        jd_key = round(julian_day * SECONDS_PER_DAY)
+        
         # Handle special case for South Node
         if planet.lower() == "south_node":
             # South Node is opposite to North Node
-            result = swe.calc_ut(julian_day, PLANETS["north_node"])
+            result = _calc_ut_cached(jd_key, PLANETS["north_node"])
             # Add 180 degrees and normalize to 0-360
             longitude = (result[0] + 180) % 360
         else:
             # Calculate planet position
-            result = swe.calc_ut(julian_day, planet_id)
+            result = _calc_ut_cached(jd_key, planet_id)
             longitude = result[0]
         
         # Extract data from Swiss Ephemeris result
@@ -139,9 +199,7 @@ class EphemerisProvider:
         speed_latitude = result[4]
         
         # Determine sign and degree within sign
-        sign_num = int(longitude / 30)
-        sign_degree = longitude % 30
-        sign_name = list(SIGNS.keys())[sign_num]
+        sign_name, sign_degree = decode_longitude(longitude)
         
         # Determine if retrograde
         is_retrograde = speed_longitude < 0
@@ -186,10 +244,14 @@ class EphemerisProvider:
         if house_system_code is None:
             raise ValueError(f"Unknown house system: {house_system}")
         
-        # Calculate houses
-        houses, ascendant, mc, armc, vertex, equatorial_ascendant = swe.houses(
-            julian_day, latitude, longitude, house_system_code
+        # Calculate houses (cached on rounded time and location)
+        houses, ascmc = _houses_cached(
+            round(julian_day * SECONDS_PER_DAY),
+            round(latitude, COORDINATE_KEY_PRECISION),
+            round(longitude, COORDINATE_KEY_PRECISION),
+            house_system_code
         )
+        ascendant, mc, armc, vertex, equatorial_ascendant = ascmc[:5]
         
         # Format results
         result = {}
@@ -198,9 +260,7 @@ class EphemerisProvider:
             house_longitude = houses[i]
             
             # Determine sign and degree
-            sign_num = int(house_longitude / 30)
-            sign_degree = house_longitude % 30
-            sign_name = list(SIGNS.keys())[sign_num]
+            sign_name, sign_degree = decode_longitude(house_longitude)
             
             result[house_num] = {
                 "longitude": house_longitude,
@@ -231,13 +291,13 @@ class EphemerisProvider:
             Julian day number
         """
         if not SWISS_EPH_AVAILABLE:
-            # Simplified calculation for development
-            # This is a rough approximation and not accurate for all dates
+            # Gregorian calendar day number for development
             a = (14 - month) // 12
             y = year + 4800 - a
             m = month + 12 * a - 3
             jdn = day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-            return jdn + hour / 24.0
+            # The day number refers to noon, so midnight is half a day earlier
+            return jdn - 0.5 + hour / 24.0
         
         # Use Swiss Ephemeris for accurate calculation
         return swe.julday(year, month, day, hour)
@@ -252,8 +312,7 @@ class EphemerisProvider:
         Returns:
             Sign name
         """
-        sign_num = int(longitude / 30) % 12
-        return list(SIGNS.keys())[sign_num]
+        return SIGN_NAMES[int(longitude / 30) % 12]
     
     def get_sign_info(self, sign_name: str) -> Dict[str, Any]:
         """
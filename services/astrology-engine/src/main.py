@@ -7,7 +7,7 @@ This service provides astrological calculations using Swiss Ephemeris.
 import time
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 from loguru import logger
 
@@ -26,6 +26,7 @@ app = FastAPI(
     title="Astrology Engine Service",
     description="Provides astrological calculations using Swiss Ephemeris",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
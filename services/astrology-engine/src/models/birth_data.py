@@ -8,6 +8,17 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import re
 
+# Year range supported by the ephemeris data files
+MIN_EPHEMERIS_YEAR = 1800
+MAX_EPHEMERIS_YEAR = 2399
+
+# 24-hour HH:MM:SS
+TIME_PATTERN = re.compile(r'^([01]?[0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])$')
+
+# Supported house systems, in display order, plus a set for membership checks
+SUPPORTED_HOUSE_SYSTEMS = ("placidus", "koch", "campanus", "regiomontanus", "equal", "whole_sign", "porphyry")
+VALID_HOUSE_SYSTEMS = frozenset(SUPPORTED_HOUSE_SYSTEMS)
+
 class GeoLocation(BaseModel):
     """Geographic location model for birth location."""
     
@@ -57,18 +68,19 @@ class BirthData(BaseModel):
         except ValueError:
             raise ValueError("Date must be in YYYY-MM-DD format")
         
-        # Check year is within valid range for ephemeris calculations (1800-2399)
+        # Check year is within valid range for ephemeris calculations
         year = int(v.split("-")[0])
-        if year < 1800 or year > 2399:
-            raise ValueError("Year must be between 1800 and 2399 for accurate calculations")
+        if year < MIN_EPHEMERIS_YEAR or year > MAX_EPHEMERIS_YEAR:
+            raise ValueError(
+                f"Year must be between {MIN_EPHEMERIS_YEAR} and {MAX_EPHEMERIS_YEAR} for accurate calculations"
+            )
         
         return v
     
     @validator('time')
     def validate_time(cls, v):
         """Validate time format is HH:MM:SS."""
-        time_pattern = re.compile(r'^([01]?[0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])$')
-        if not time_pattern.match(v):
+        if not TIME_PATTERN.match(v):
             raise ValueError("Time must be in HH:MM:SS format (24-hour)")
         return v
     
@@ -108,9 +120,8 @@ class ChartOptions(BaseModel):
     @validator('house_system')
     def validate_house_system(cls, v):
         """Validate house system is supported."""
-        valid_systems = ["placidus", "koch", "campanus", "regiomontanus", "equal", "whole_sign", "porphyry"]
-        if v.lower() not in valid_systems:
-            raise ValueError(f"House system must be one of: {', '.join(valid_systems)}")
+        if v.lower() not in VALID_HOUSE_SYSTEMS:
+            raise ValueError(f"House system must be one of: {', '.join(SUPPORTED_HOUSE_SYSTEMS)}")
         return v.lower()
     
     class Config:
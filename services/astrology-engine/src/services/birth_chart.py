@@ -7,6 +7,7 @@ from loguru import logger
 from typing import Dict, List, Optional, Any
 import uuid
 from datetime import datetime
+from functools import lru_cache
 
 # Import models
 from models.birth_data import BirthData, ChartOptions
@@ -27,6 +28,9 @@ class BirthChartService:
         """Initialize the service with required dependencies."""
         self.ephemeris_provider = EphemerisProvider(settings.EPHEMERIS_PATH)
         self.calculator = AstrologyCalculator(self.ephemeris_provider)
+        
+        # A chart summary depends only on its date, time and location
+        self._chart_summary_cached = lru_cache(maxsize=1024)(self._compute_chart_summary)
     
     async def calculate_chart(self, birth_data: BirthData, options: ChartOptions) -> ChartResponse:
         """
@@ -39,7 +43,12 @@ class BirthChartService:
         Returns:
             A complete ChartResponse object
         """
-        logger.info(f"Calculating chart for {birth_data.date}, {birth_data.time}, {birth_data.location.location_name}")
+        # The router already logs each request at INFO level; loguru only
+        # formats these arguments when DEBUG is enabled
+        logger.debug(
+            "Calculating chart for {}, {}, {}",
+            birth_data.date, birth_data.time, birth_data.location.location_name
+        )
         
         try:
             # Generate chart ID
@@ -122,7 +131,7 @@ class BirthChartService:
         Returns:
             The chart response or None if not found
         """
-        logger.info(f"Retrieving chart with ID: {chart_id}")
+        logger.debug("Retrieving chart with ID: {}", chart_id)
         
         # TODO: Implement retrieval from cache/database
         # For now, return None as if the chart doesn't exist
@@ -147,7 +156,7 @@ class BirthChartService:
         Returns:
             A dictionary with summary information
         """
-        logger.info(f"Calculating chart summary for date: {date}, time: {time}")
+        logger.debug("Calculating chart summary for date: {}, time: {}", date, time)
         
         try:
             # If time is not provided, use noon
@@ -159,49 +168,8 @@ class BirthChartService:
                 latitude = 51.4769
                 longitude = 0.0
             
-            # Convert to Julian day
-            julian_day = self.calculator.get_julian_day(
-                date=date,
-                time=time,
-                timezone="UTC"  # Assume UTC if no timezone provided
-            )
-            
-            # Calculate sun sign
-            sun_position = self.calculator.calculate_planet_position(
-                planet="sun",
-                julian_day=julian_day
-            )
-            sun_sign = self.calculator.get_sign_name(sun_position["longitude"])
-            
-            # Calculate moon sign
-            moon_position = self.calculator.calculate_planet_position(
-                planet="moon",
-                julian_day=julian_day
-            )
-            moon_sign = self.calculator.get_sign_name(moon_position["longitude"])
-            
-            # Calculate ascendant if time and location are provided
-            ascendant = None
-            if time is not None and latitude is not None and longitude is not None:
-                houses = self.calculator.calculate_houses(
-                    julian_day=julian_day,
-                    latitude=latitude,
-                    longitude=longitude,
-                    house_system="placidus"
-                )
-                ascendant_longitude = houses[1]["longitude"]
-                ascendant = self.calculator.get_sign_name(ascendant_longitude)
-            
-            # Create summary response
-            summary = {
-                "sun_sign": sun_sign,
-                "moon_sign": moon_sign
-            }
-            
-            if ascendant:
-                summary["ascendant"] = ascendant
-            
-            return summary
+            # Copy so callers cannot modify the memoized summary
+            return dict(self._chart_summary_cached(date, time, latitude, longitude))
             
         except Exception as e:
             logger.error(f"Error calculating chart summary: {str(e)}")
@@ -209,6 +177,51 @@ class BirthChartService:
     
     # Private helper methods
     
+    def _compute_chart_summary(
+        self,
+        date: str,
+        time: str,
+        latitude: float,
+        longitude: float
+    ) -> Dict[str, Any]:
+        """Calculate sun sign, moon sign and ascendant for a moment and place."""
+        # Convert to Julian day
+        julian_day = self.calculator.get_julian_day(
+            date=date,
+            time=time,
+            timezone="UTC"  # Assume UTC if no timezone provided
+        )
+        
+        # Calculate sun sign
+        sun_position = self.calculator.calculate_planet_position(
+            planet="sun",
+            julian_day=julian_day
+        )
+        sun_sign = self.calculator.get_sign_name(sun_position["longitude"])
+        
+        # Calculate moon sign
+        moon_position = self.calculator.calculate_planet_position(
+            planet="moon",
+            julian_day=julian_day
+        )
+        moon_sign = self.calculator.get_sign_name(moon_position["longitude"])
+        
+        # Calculate ascendant
+        houses = self.calculator.calculate_houses(
+            julian_day=julian_day,
+            latitude=latitude,
+            longitude=longitude,
+            house_system="placidus"
+        )
+        ascendant = self.calculator.get_sign_name(houses[1]["longitude"])
+        
+        # Create summary response
+        return {
+            "sun_sign": sun_sign,
+            "moon_sign": moon_sign,
+            "ascendant": ascendant
+        }
+    
     async def _calculate_planet_positions(
         self,
         julian_day: float,
@@ -0,0 +1,10 @@
+"""
+Pytest configuration for the astrology engine.
+
+Service modules import each other as top-level packages (``core``,
+``models``, ...), so the source directory is put on the path.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,44 @@
+"""
+Tests for the birth chart service.
+"""
+import asyncio
+
+import pytest
+
+from services.birth_chart import BirthChartService
+
+
+@pytest.fixture
+def service():
+    return BirthChartService()
+
+
+def summary(service, *args):
+    return asyncio.run(service.get_chart_summary(*args))
+
+
+def test_repeated_summary_hits_cache(service):
+    first = summary(service, "1990-05-17", "08:30:00", 40.7128, -74.006)
+    second = summary(service, "1990-05-17", "08:30:00", 40.7128, -74.006)
+    
+    info = service._chart_summary_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert second == first
+
+
+def test_default_inputs_share_entry_with_explicit_noon_greenwich(service):
+    implicit = summary(service, "1990-05-17")
+    explicit = summary(service, "1990-05-17", "12:00:00", 51.4769, 0.0)
+    
+    info = service._chart_summary_cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert explicit == implicit
+
+
+def test_modifying_returned_summary_leaves_cache_intact(service):
+    first = summary(service, "1990-05-17")
+    expected = dict(first)
+    first["sun_sign"] = "modified"
+    first["extra"] = True
+    
+    assert summary(service, "1990-05-17") == expected
@@ -0,0 +1,108 @@
+"""
+Tests for the astrology calculator.
+"""
+import copy
+import os
+
+import pytest
+
+from core.calculator import (
+    ALL_ASPECTS,
+    ASPECT_ORBS,
+    MAJOR_ASPECTS,
+    AspectHit,
+    AstrologyCalculator
+)
+from core.ephemeris import EphemerisProvider
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return AstrologyCalculator(EphemerisProvider(os.environ.get("EPHEMERIS_PATH", "/app/ephe")))
+
+
+def positions(**longitudes):
+    return {planet: {"longitude": longitude, "speed": 1.0} for planet, longitude in longitudes.items()}
+
+
+def test_aspects_are_aspect_hit_records(calculator):
+    aspects = calculator.calculate_aspects(positions(sun=10.0, moon=130.0))
+    
+    assert len(aspects) == 1
+    hit = aspects[0]
+    assert isinstance(hit, AspectHit)
+    assert (hit.planet1, hit.planet2, hit.type, hit.angle) == ("sun", "moon", "trine", 120)
+    assert hit.orb == pytest.approx(0.0)
+    
+    # Mapping form is only available through _asdict()
+    assert hit._asdict() == {
+        "planet1": "sun",
+        "planet2": "moon",
+        "type": "trine",
+        "angle": 120,
+        "orb": hit.orb,
+        "applying": hit.applying,
+        "influence": hit.influence
+    }
+    with pytest.raises(TypeError):
+        hit["orb"]
+
+
+def test_custom_orbs_do_not_modify_shared_tables(calculator):
+    all_aspects = copy.deepcopy(ALL_ASPECTS)
+    major_aspects = copy.deepcopy(MAJOR_ASPECTS)
+    aspect_orbs = ASPECT_ORBS.copy()
+    
+    # Sun/Moon are 7 degrees from a trine: only within orb with the custom orb
+    wide = calculator.calculate_aspects(positions(sun=0.0, moon=127.0), custom_orbs={"trine": 8.0})
+    assert [hit.type for hit in wide] == ["trine"]
+    
+    assert ALL_ASPECTS == all_aspects
+    assert MAJOR_ASPECTS == major_aspects
+    assert (ASPECT_ORBS == aspect_orbs).all()
+    
+    # A later call without custom orbs uses the default orb again
+    assert calculator.calculate_aspects(positions(sun=0.0, moon=127.0)) == []
+
+
+def test_hits_follow_pair_order_then_aspect_order(calculator):
+    # Three exact trines have equal influence, so the stable sort keeps the
+    # upper-triangle pair order of the input
+    aspects = calculator.calculate_aspects(positions(sun=0.0, moon=120.0, mars=240.0))
+    assert [(hit.planet1, hit.planet2) for hit in aspects] == [
+        ("sun", "moon"),
+        ("sun", "mars"),
+        ("moon", "mars")
+    ]
+    
+    # 108 degrees is 36 from both a quintile and a bi-quintile; with equal
+    # orbs both hits have equal influence and keep the requested aspect order
+    orbs = {"quintile": 40.0, "bi_quintile": 40.0}
+    for requested in (["quintile", "bi_quintile"], ["bi_quintile", "quintile"]):
+        aspects = calculator.calculate_aspects(positions(sun=0.0, moon=108.0), requested, orbs)
+        assert [hit.type for hit in aspects] == requested
+
+
+def test_duplicate_and_unknown_aspect_names(calculator):
+    aspects = calculator.calculate_aspects(
+        positions(sun=0.0, moon=120.0),
+        ["trine", "trine", "not_an_aspect"]
+    )
+    
+    assert [(hit.planet1, hit.planet2, hit.type) for hit in aspects] == [("sun", "moon", "trine")]
+
+
+@pytest.mark.parametrize("planet_positions", [{}, positions(sun=10.0)])
+def test_fewer_than_two_planets_have_no_aspects(calculator, planet_positions):
+    assert calculator.calculate_aspects(planet_positions) == []
+    assert calculator.calculate_aspects(planet_positions, []) == []
+
+
+def test_aspects_wrap_around_zero_degrees(calculator):
+    conjunction = calculator.calculate_aspects(positions(sun=359.0, moon=1.0))
+    square = calculator.calculate_aspects(positions(sun=355.0, moon=87.0))
+    
+    assert [hit.type for hit in conjunction] == ["conjunction"]
+    assert conjunction[0].orb == pytest.approx(2.0)
+    assert [hit.type for hit in square] == ["square"]
+    assert square[0].orb == pytest.approx(2.0)
@@ -0,0 +1,101 @@
+"""
+Tests for the ephemeris provider.
+"""
+import os
+
+import pytest
+
+swe = pytest.importorskip("swisseph")
+
+import core.ephemeris
+from core.ephemeris import (
+    CALC_FLAGS,
+    HOUSE_SYSTEMS,
+    PLANETS,
+    EphemerisProvider,
+    _calc_ut_cached,
+    _houses_cached
+)
+
+# A moment with a sub-second fraction and coordinates with more than four
+# decimals, so the cached calls see quantized inputs
+JULIAN_DAY = 2460311.0123456789
+LATITUDE = 40.712776
+LONGITUDE = -74.005974
+
+
+@pytest.fixture(scope="module")
+def provider():
+    return EphemerisProvider(os.environ.get("EPHEMERIS_PATH", "/app/ephe"))
+
+
+def test_cached_houses_match_direct_call(provider):
+    houses = provider.calculate_houses(JULIAN_DAY, LATITUDE, LONGITUDE, "placidus")
+    cusps, ascmc = swe.houses(JULIAN_DAY, LATITUDE, LONGITUDE, HOUSE_SYSTEMS["placidus"])
+    
+    # Half a second of time and 0.00005 degrees of location move a cusp by
+    # well under 0.01 degrees
+    for house_num in range(1, 13):
+        assert houses[house_num]["longitude"] == pytest.approx(cusps[house_num - 1], abs=0.01)
+    assert houses["ascendant"] == pytest.approx(ascmc[0], abs=0.01)
+    assert houses["mc"] == pytest.approx(ascmc[1], abs=0.01)
+
+
+def test_repeated_houses_hit_cache(provider):
+    provider.calculate_houses(JULIAN_DAY, LATITUDE, LONGITUDE, "koch")
+    hits = _houses_cached.cache_info().hits
+    
+    # Same chart, with inputs that differ only below the cache resolution
+    provider.calculate_houses(JULIAN_DAY + 1e-7, LATITUDE + 1e-6, LONGITUDE, "koch")
+    
+    assert _houses_cached.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize("planet", ["sun", "moon", "mars", "pluto", "north_node"])
+def test_cached_positions_match_direct_call(provider, planet):
+    position = provider.calculate_planet_position(planet, JULIAN_DAY)
+    xx, _ = swe.calc_ut(JULIAN_DAY, PLANETS[planet], CALC_FLAGS)
+    
+    # Half a second moves even the Moon by less than 0.0001 degrees
+    assert position["longitude"] == pytest.approx(xx[0], abs=1e-4)
+    assert position["latitude"] == pytest.approx(xx[1], abs=1e-4)
+    assert position["speed"] == pytest.approx(xx[3], abs=1e-4)
+
+
+def test_south_node_opposes_cached_north_node(provider):
+    north = provider.calculate_planet_position("north_node", JULIAN_DAY)
+    south = provider.calculate_planet_position("south_node", JULIAN_DAY)
+    
+    assert south["longitude"] == pytest.approx((north["longitude"] + 180) % 360)
+
+
+def test_repeated_positions_hit_cache(provider):
+    provider.calculate_planet_position("venus", JULIAN_DAY)
+    hits = _calc_ut_cached.cache_info().hits
+    
+    # Same second, so the same cache entry
+    provider.calculate_planet_position("venus", JULIAN_DAY + 1e-7)
+    
+    assert _calc_ut_cached.cache_info().hits == hits + 1
+
+
+@pytest.fixture
+def fallback_provider(provider, monkeypatch):
+    monkeypatch.setattr(core.ephemeris, "SWISS_EPH_AVAILABLE", False)
+    return provider
+
+
+def test_fallback_julian_day_at_j2000(fallback_provider):
+    assert fallback_provider.get_julian_day(2000, 1, 1, 12.0) == 2451545.0
+
+
+@pytest.mark.parametrize("year, month, day, hour", [
+    (1900, 3, 1, 0.0),
+    (1969, 7, 20, 20.2833),
+    (2000, 2, 29, 6.5),
+    (2024, 12, 31, 23.999)
+])
+def test_fallback_julian_day_matches_swisseph(fallback_provider, year, month, day, hour):
+    expected = swe.julday(year, month, day, hour)
+    
+    assert fallback_provider.get_julian_day(year, month, day, hour) == pytest.approx(expected, abs=1e-9)